@@ -0,0 +1,81 @@
+"""add change log and updated_at columns
+
+Revision ID: 3f2a9c1d7b64
+Revises:
+Create Date: 2026-10-19 20:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f2a9c1d7b64'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Tables that predate the change log, keyed by their entity type in the feed
+SYNCED_TABLES = {
+    "problem": "problems",
+    "solution": "solutions",
+    "test_case": "test_cases",
+    "practice_record": "practice_records",
+}
+
+change_operation = sa.Enum("CREATED", "UPDATED", "DELETED", name="changeoperation")
+
+
+def _columns(table_name):
+    return {column["name"] for column in sa.inspect(op.get_bind()).get_columns(table_name)}
+
+
+def upgrade() -> None:
+    # Importing app.models (from env.py) runs create_all, so on a fresh
+    # database everything below may already exist
+    for table_name in ("solutions", "test_cases", "practice_records"):
+        if "updated_at" not in _columns(table_name):
+            op.add_column(table_name, sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True))
+
+    if not sa.inspect(op.get_bind()).has_table("change_log"):
+        op.create_table(
+            "change_log",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("entity_type", sa.String(), nullable=True),
+            sa.Column("entity_id", sa.Integer(), nullable=True),
+            sa.Column("operation", change_operation, nullable=True),
+            sa.Column("changed_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        )
+        op.create_index("ix_change_log_id", "change_log", ["id"])
+        op.create_index("ix_change_log_entity_type", "change_log", ["entity_type"])
+        op.create_index("ix_change_log_entity_id", "change_log", ["entity_id"])
+
+    # Backfill CREATED entries for rows written before the change log existed,
+    # so a client syncing from cursor 0 receives the whole catalogue
+    bind = op.get_bind()
+    change_log = sa.table(
+        "change_log",
+        sa.column("entity_type", sa.String),
+        sa.column("entity_id", sa.Integer),
+        sa.column("operation", change_operation),
+    )
+    for entity_type, table_name in SYNCED_TABLES.items():
+        logged = sa.select(change_log.c.entity_id).where(change_log.c.entity_type == entity_type)
+        table = sa.table(table_name, sa.column("id", sa.Integer))
+        ids = bind.execute(
+            sa.select(table.c.id).where(table.c.id.not_in(logged)).order_by(table.c.id)
+        ).scalars().all()
+        if ids:
+            op.bulk_insert(change_log, [
+                {"entity_type": entity_type, "entity_id": entity_id, "operation": "CREATED"}
+                for entity_id in ids
+            ])
+
+
+def downgrade() -> None:
+    op.drop_table("change_log")
+    change_operation.drop(op.get_bind(), checkfirst=True)
+    for table_name in ("solutions", "test_cases", "practice_records"):
+        # Batch mode so the drop also works on SQLite
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.drop_column("updated_at")
@@ -0,0 +1,57 @@
+"""add solution content hash and analysis
+
+Revision ID: 8b1e4d5a2c90
+Revises: 3f2a9c1d7b64
+Create Date: 2026-10-19 20:45:00.000000
+
+"""
+import hashlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b1e4d5a2c90'
+down_revision = '3f2a9c1d7b64'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Importing app.models (from env.py) runs create_all, so on a fresh
+    # database the columns may already exist
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("solutions")}
+    if "content_hash" not in columns:
+        op.add_column("solutions", sa.Column("content_hash", sa.String(), nullable=True))
+        op.create_index("ix_solutions_content_hash", "solutions", ["content_hash"])
+    if "analysis" not in columns:
+        op.add_column("solutions", sa.Column("analysis", sa.JSON(), nullable=True))
+
+    # Backfill content hashes for solutions saved before this revision. The
+    # analysis facts depend on the current analysis passes, so the application
+    # fills them in lazily (FileManager.ensure_analysis) instead
+    bind = op.get_bind()
+    solutions = sa.table(
+        "solutions",
+        sa.column("id", sa.Integer),
+        sa.column("code", sa.String),
+        sa.column("content_hash", sa.String),
+    )
+    rows = bind.execute(
+        sa.select(solutions.c.id, solutions.c.code).where(solutions.c.content_hash.is_(None))
+    ).all()
+    for solution_id, code in rows:
+        bind.execute(
+            solutions.update()
+            .where(solutions.c.id == solution_id)
+            .values(content_hash=hashlib.sha256((code or "").encode("utf-8")).hexdigest())
+        )
+
+
+def downgrade() -> None:
+    # Batch mode so the drop also works on SQLite
+    with op.batch_alter_table("solutions") as batch_op:
+        batch_op.drop_index("ix_solutions_content_hash")
+        batch_op.drop_column("analysis")
+        batch_op.drop_column("content_hash")
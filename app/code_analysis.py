@@ -0,0 +1,197 @@
+import ast
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, asdict
+from typing import Callable, Dict, Any, List, Tuple
+
+ENTRY_POINT = "solution"
+FORBIDDEN_MODULES = {"os", "subprocess", "shutil", "socket", "ctypes", "multiprocessing", "importlib"}
+# Builtins that can import modules or run code the import check never sees
+FORBIDDEN_CALLS = {"__import__", "eval", "exec", "compile"}
+# Calls that terminate the program, and so end any loop they appear in
+EXIT_CALLS = {"exit", "quit", "sys.exit", "os._exit"}
+CACHE_SIZE = 256
+
+@dataclass(frozen=True)
+class CodeFacts:
+    content_hash: str
+    functions: Tuple[str, ...] = ()
+    classes: Tuple[str, ...] = ()
+    imports: Tuple[str, ...] = ()
+    node_count: int = 0
+    cyclomatic_complexity: int = 1
+    max_loop_depth: int = 0
+    errors: Tuple[str, ...] = ()
+    warnings: Tuple[str, ...] = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+@dataclass
+class _PassReport:
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+def content_hash(code: str) -> str:
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+def _collect_imports(tree: ast.AST) -> List[str]:
+    modules = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules.append(node.module)
+    return sorted(set(modules))
+
+def _cyclomatic_complexity(tree: ast.AST) -> int:
+    """McCabe complexity of the whole module: one plus every decision point."""
+    complexity = 1
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.If, ast.For, ast.AsyncFor, ast.While, ast.IfExp,
+                             ast.ExceptHandler, ast.comprehension, ast.Assert)):
+            complexity += 1
+        elif isinstance(node, ast.BoolOp):
+            complexity += len(node.values) - 1
+    return complexity
+
+def _max_loop_depth(tree: ast.AST) -> int:
+    # Iterative, so deeply nested code cannot overflow the interpreter stack
+    deepest = 0
+    pending = [(tree, 0)]
+    while pending:
+        node, depth = pending.pop()
+        deepest = max(deepest, depth)
+        for child in ast.iter_child_nodes(node):
+            is_loop = isinstance(child, (ast.For, ast.AsyncFor, ast.While))
+            pending.append((child, depth + 1 if is_loop else depth))
+    return deepest
+
+def _call_name(node: ast.Call) -> str:
+    """Dotted name of the called function, or an empty string if it is not a plain name."""
+    parts = []
+    func = node.func
+    while isinstance(func, ast.Attribute):
+        parts.append(func.attr)
+        func = func.value
+    if not isinstance(func, ast.Name):
+        return ""
+    parts.append(func.id)
+    return ".".join(reversed(parts))
+
+def _loop_exit(loop: ast.While) -> str:
+    """
+    Classify how a loop can be left: "exit" if the body contains a break,
+    return, raise, assert, yield, await or exit call that leaves it,
+    "unknown" if it only contains operations that may raise (calls,
+    subscripts, attribute access, division), and "none" if nothing in it can.
+    """
+    may_raise = False
+    # (node, whether a break at this level still leaves the loop being checked)
+    pending = [(node, True) for node in loop.body]
+    while pending:
+        node, break_exits = pending.pop()
+        if isinstance(node, (ast.Return, ast.Raise, ast.Assert, ast.Yield, ast.YieldFrom, ast.Await)) \
+                or (break_exits and isinstance(node, ast.Break)):
+            return "exit"
+        if isinstance(node, ast.Call):
+            if _call_name(node) in EXIT_CALLS:
+                return "exit"
+            may_raise = True
+        # An exception raised here may be caught outside the loop to end it
+        elif isinstance(node, (ast.Subscript, ast.Attribute)) \
+                or (isinstance(node, (ast.BinOp, ast.AugAssign))
+                    and isinstance(node.op, (ast.Div, ast.FloorDiv, ast.Mod))):
+            may_raise = True
+        # Nested functions and classes run in their own frame
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)):
+            continue
+        # A break inside a nested loop only leaves that loop
+        nested_loop = isinstance(node, (ast.For, ast.AsyncFor, ast.While))
+        pending.extend((child, break_exits and not nested_loop) for child in ast.iter_child_nodes(node))
+    return "unknown" if may_raise else "none"
+
+def _check_forbidden_imports(tree: ast.AST, facts: Dict[str, Any], report: _PassReport):
+    for module in facts["imports"]:
+        if module.split(".")[0] in FORBIDDEN_MODULES:
+            report.errors.append(f"Forbidden import: {module}")
+
+def _check_dynamic_code(tree: ast.AST, facts: Dict[str, Any], report: _PassReport):
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            name = _call_name(node)
+            if name in FORBIDDEN_CALLS or name.split(".")[0] in FORBIDDEN_MODULES:
+                report.errors.append(f"Forbidden call: {name}() on line {node.lineno}")
+
+def _check_infinite_loops(tree: ast.AST, facts: Dict[str, Any], report: _PassReport):
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.While) and isinstance(node.test, ast.Constant) and node.test.value):
+            continue
+        exit_kind = _loop_exit(node)
+        if exit_kind == "none":
+            report.errors.append(f"Infinite loop without break on line {node.lineno}")
+        elif exit_kind == "unknown":
+            report.warnings.append(f"Possible infinite loop on line {node.lineno}: no break, return or raise")
+
+def _check_entry_point(tree: ast.AST, facts: Dict[str, Any], report: _PassReport):
+    if ENTRY_POINT not in facts["functions"]:
+        report.warnings.append(f"Missing entry point: no '{ENTRY_POINT}' function defined")
+
+# Passes run in order over the parsed tree; each may add errors (reject) or warnings (flag)
+ANALYSIS_PASSES: List[Callable[[ast.AST, Dict[str, Any], _PassReport], None]] = [
+    _check_forbidden_imports,
+    _check_dynamic_code,
+    _check_infinite_loops,
+    _check_entry_point,
+]
+
+_facts_cache: "OrderedDict[str, CodeFacts]" = OrderedDict()
+# Handlers run in a threadpool, so cache lookups and evictions must not interleave
+_facts_cache_lock = threading.Lock()
+
+def analyze_code(code: str) -> CodeFacts:
+    """
+    Parse the code once and run every analysis pass over it.
+    Results are cached by content hash, so resubmitting the same code
+    (validate, then run tests, then save) only pays for the parse once.
+    Raises SyntaxError if the code cannot be parsed, and ValueError or
+    RecursionError if it is too malformed or deeply nested to parse.
+    """
+    key = content_hash(code)
+    with _facts_cache_lock:
+        cached = _facts_cache.get(key)
+        if cached is not None:
+            _facts_cache.move_to_end(key)
+            return cached
+
+    tree = ast.parse(code)
+    top_level = tree.body
+    facts = {
+        "functions": tuple(node.name for node in top_level
+                           if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))),
+        "classes": tuple(node.name for node in top_level if isinstance(node, ast.ClassDef)),
+        "imports": tuple(_collect_imports(tree)),
+    }
+
+    report = _PassReport()
+    for analysis_pass in ANALYSIS_PASSES:
+        analysis_pass(tree, facts, report)
+
+    result = CodeFacts(
+        content_hash=key,
+        node_count=sum(1 for _ in ast.walk(tree)),
+        cyclomatic_complexity=_cyclomatic_complexity(tree),
+        max_loop_depth=_max_loop_depth(tree),
+        errors=tuple(report.errors),
+        warnings=tuple(report.warnings),
+        **facts,
+    )
+
+    # Analysis itself runs unlocked; a concurrent miss on the same code just
+    # stores an equal result twice
+    with _facts_cache_lock:
+        _facts_cache[key] = result
+        while len(_facts_cache) > CACHE_SIZE:
+            _facts_cache.popitem(last=False)
+    return result
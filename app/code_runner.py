@@ -1,24 +1,47 @@
-import ast
 import sys
 import unittest
 import io
-from typing import Dict, Any, Tuple
-from dataclasses import dataclass
+from typing import Dict, Any, Tuple, List, Optional
+from dataclasses import dataclass, field
+import threading
 import traceback
+from .code_analysis import analyze_code, CodeFacts
+
+# sys.stdout is process-wide, so concurrent in-process executions must not overlap
+_stdout_lock = threading.Lock()
 
 @dataclass
 class RunResult:
     success: bool
     output: str
     error_message: str = ""
+    warnings: List[str] = field(default_factory=list)
+    facts: Optional[CodeFacts] = None
 
 class CodeRunner:
     @staticmethod
     def validate_syntax(code: str) -> RunResult:
-        """Validate Python code syntax without executing it."""
+        """
+        Validate Python code without executing it.
+        Besides parsing, runs the static analysis passes so submissions with
+        forbidden imports or obvious infinite loops are rejected up front.
+        """
         try:
-            ast.parse(code)
-            return RunResult(success=True, output="Code syntax is valid")
+            facts = analyze_code(code)
+            if facts.errors:
+                return RunResult(
+                    success=False,
+                    output="",
+                    error_message="Static Analysis Error: " + "; ".join(facts.errors),
+                    warnings=list(facts.warnings),
+                    facts=facts
+                )
+            return RunResult(
+                success=True,
+                output="Code syntax is valid",
+                warnings=list(facts.warnings),
+                facts=facts
+            )
         except SyntaxError as e:
             return RunResult(
                 success=False,
@@ -35,6 +58,22 @@ class CodeRunner:
     @staticmethod
     def run_tests(source_code: str, test_code: str) -> RunResult:
         """Run unit tests against the provided source code."""
+        # Reject code that fails the pre-flight checks before executing anything
+        preflight = CodeRunner.validate_syntax(source_code)
+        if not preflight.success:
+            return preflight
+        test_preflight = CodeRunner.validate_syntax(test_code)
+        if not test_preflight.success:
+            return test_preflight
+
+        # Report the source code's analysis alongside the test outcome
+        result = CodeRunner._execute_tests(source_code, test_code)
+        result.warnings = preflight.warnings
+        result.facts = preflight.facts
+        return result
+
+    @staticmethod
+    def _execute_tests(source_code: str, test_code: str) -> RunResult:
         # Create a new test loader and runner
         loader = unittest.TestLoader()
         runner = unittest.TextTestRunner(stream=io.StringIO())
@@ -88,6 +127,15 @@ class CodeRunner:
     @staticmethod
     def execute_code(code: str) -> RunResult:
         """Execute the provided code and capture its output."""
+        validation = CodeRunner.validate_syntax(code)
+        if not validation.success:
+            return validation
+
+        with _stdout_lock:
+            return CodeRunner._exec_capturing_stdout(code, validation)
+
+    @staticmethod
+    def _exec_capturing_stdout(code: str, validation: RunResult) -> RunResult:
         # Redirect stdout to capture print statements
         stdout = io.StringIO()
         sys.stdout = stdout
@@ -95,12 +143,19 @@ class CodeRunner:
         try:
             exec(code)
             output = stdout.getvalue()
-            return RunResult(success=True, output=output)
+            return RunResult(
+                success=True,
+                output=output,
+                warnings=validation.warnings,
+                facts=validation.facts
+            )
         except Exception as e:
             return RunResult(
                 success=False,
                 output=stdout.getvalue(),
-                error_message=f"Execution Error: {str(e)}\n{traceback.format_exc()}"
+                error_message=f"Execution Error: {str(e)}\n{traceback.format_exc()}",
+                warnings=validation.warnings,
+                facts=validation.facts
             )
         finally:
             sys.stdout = sys.__stdout__
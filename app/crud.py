@@ -1,3 +1,4 @@
+from sqlalchemy import inspect
 from sqlalchemy.orm import Session, joinedload
 from datetime import datetime, timedelta
 import math
@@ -53,10 +54,11 @@ def create_solution(db: Session, solution: schemas.SolutionCreate):
     return db_solution
 
 def get_solutions(db: Session, problem_id: int):
-    return db.query(models.Solution)\
+    solutions = db.query(models.Solution)\
         .options(joinedload(models.Solution.test_cases))\
         .filter(models.Solution.problem_id == problem_id)\
         .all()
+    return file_manager.ensure_analysis(db, solutions)
 
 def create_test_case(db: Session, test_case: schemas.TestCaseCreate):
     db_test_case = models.TestCase(
@@ -118,3 +120,64 @@ def get_problems_for_practice(db: Session, limit: int = 10):
         .order_by(models.PracticeRecord.next_review_date)\
         .limit(limit)\
         .all()
+
+def _row_to_dict(obj) -> dict:
+    data = {attr.key: getattr(obj, attr.key) for attr in inspect(obj).mapper.column_attrs}
+    if isinstance(obj, models.Problem):
+        data["tags"] = [tag.name for tag in obj.tags]
+    return data
+
+def get_changes_since(db: Session, since: int = 0, limit: int = 100):
+    """
+    Return one page of the change feed after the `since` cursor.
+    Several changes to the same row within the page are collapsed into the
+    latest one, and the current row state is attached to every change that
+    is not a deletion so clients only download what actually changed.
+    """
+    entries = db.query(models.ChangeLog)\
+        .filter(models.ChangeLog.id > since)\
+        .order_by(models.ChangeLog.id)\
+        .limit(limit + 1)\
+        .all()
+
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+    next_cursor = entries[-1].id if entries else since
+
+    # Keep only the latest change per row, preserving cursor order
+    latest = {}
+    for entry in entries:
+        key = (entry.entity_type, entry.entity_id)
+        latest.pop(key, None)
+        latest[key] = entry
+
+    # Load the current state of all surviving rows with one query per entity type
+    ids_by_type = {}
+    for entry in latest.values():
+        if entry.operation != models.ChangeOperation.DELETED:
+            ids_by_type.setdefault(entry.entity_type, []).append(entry.entity_id)
+
+    rows = {}
+    for entity_type, ids in ids_by_type.items():
+        model = models.SYNCED_MODELS[entity_type]
+        query = db.query(model)
+        if model is models.Problem:
+            query = query.options(joinedload(models.Problem.tags))
+        for obj in query.filter(model.id.in_(ids)).all():
+            rows[(entity_type, obj.id)] = _row_to_dict(obj)
+
+    changes = []
+    for key, entry in latest.items():
+        data = rows.get(key)
+        # A row that no longer exists was deleted after this entry; its own
+        # DELETED entry comes later in the feed, but report it as deleted now
+        operation = entry.operation if data is not None else models.ChangeOperation.DELETED
+        changes.append(schemas.Change(
+            cursor=entry.id,
+            entity_type=entry.entity_type,
+            entity_id=entry.entity_id,
+            operation=operation,
+            changed_at=entry.changed_at,
+            data=data,
+        ))
+    return schemas.SyncPage(changes=changes, next_cursor=next_cursor, has_more=has_more)
@@ -1,8 +1,9 @@
 import os
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 from sqlalchemy.orm import Session
 from . import models, schemas
+from .code_analysis import analyze_code, content_hash
 
 class FileManager:
     def __init__(self, base_path: str = "solutions"):
@@ -29,13 +30,40 @@ class FileManager:
         }
         return extensions.get(language.lower(), "txt")
 
+    def _analyze(self, code: str, language: str) -> Optional[dict]:
+        """Static analysis facts for Python code, or None if they cannot be computed."""
+        if language.lower() != "python":
+            return None
+        try:
+            return analyze_code(code).to_dict()
+        except (SyntaxError, RecursionError, ValueError):
+            return None  # Invalid code is still saved, just without facts
+
+    def ensure_analysis(self, db: Session, solutions: List[models.Solution]) -> List[models.Solution]:
+        """Fill in analysis facts for solutions saved before they were recorded."""
+        updated = False
+        for solution in solutions:
+            if solution.analysis is None and solution.language:
+                analysis = self._analyze(solution.code or "", solution.language)
+                if analysis is not None:
+                    solution.analysis = analysis
+                    updated = True
+        if updated:
+            db.commit()
+        return solutions
+
     def save_solution(self, db: Session, solution: schemas.SolutionCreate) -> models.Solution:
         """Save a solution to both database and filesystem."""
+        # Store the static analysis facts alongside Python solutions
+        analysis = self._analyze(solution.code, solution.language)
+
         # First, save to database
         db_solution = models.Solution(
             problem_id=solution.problem_id,
             code=solution.code,
-            language=solution.language
+            language=solution.language,
+            content_hash=content_hash(solution.code),
+            analysis=analysis
         )
         db.add(db_solution)
         db.commit()
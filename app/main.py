@@ -2,6 +2,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .routers import router
 from .database import init_db
+from .runner_backends import discover_backends
 from app.routes import code_runner
 
 app = FastAPI(title="DevDojo API", version="1.0.0")
@@ -18,6 +19,9 @@ app.add_middleware(
 # Initialize database
 init_db()
 
+# Register runner backends for the toolchains installed on this machine
+discover_backends()
+
 # Include our routers
 app.include_router(router, prefix="/api/v1")
 app.include_router(code_runner.router, prefix="/code-runner", tags=["code-runner"])
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Enum, Table, Float
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Enum, Table, Float, JSON, event, inspect
+from sqlalchemy.orm import relationship, Session
+from sqlalchemy.sql import func, text
 import enum
 from .database import Base
 
@@ -17,6 +17,11 @@ class DifficultyLevel(str, enum.Enum):
     MEDIUM = "medium"
     HARD = "hard"
 
+class ChangeOperation(str, enum.Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
 class Problem(Base):
     __tablename__ = "problems"
 
@@ -41,7 +46,10 @@ class Solution(Base):
     code = Column(String)
     language = Column(String)
     file_path = Column(String)
+    content_hash = Column(String, index=True)
+    analysis = Column(JSON)  # Static analysis facts, see code_analysis.CodeFacts
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
     problem = relationship("Problem", back_populates="solutions")
@@ -55,6 +63,7 @@ class TestCase(Base):
     input_data = Column(String)
     expected_output = Column(String)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
     solution = relationship("Solution", back_populates="test_cases")
@@ -77,6 +86,77 @@ class PracticeRecord(Base):
     last_practiced = Column(DateTime(timezone=True))
     next_review_date = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
     problem = relationship("Problem", back_populates="practice_records")
+
+class ChangeLog(Base):
+    __tablename__ = "change_log"
+
+    # The autoincrementing id doubles as the sync cursor handed to clients.
+    # Ids are assigned at flush time, so writers are serialised (see
+    # record_changes) to make them commit in id order; otherwise a client
+    # could advance its cursor past a lower id that is still uncommitted.
+    id = Column(Integer, primary_key=True, index=True)
+    entity_type = Column(String, index=True)
+    entity_id = Column(Integer, index=True)
+    operation = Column(Enum(ChangeOperation))
+    changed_at = Column(DateTime(timezone=True), server_default=func.now())
+
+# Entities mirrored by offline clients, keyed by the name used in the change feed
+SYNCED_MODELS = {
+    "problem": Problem,
+    "solution": Solution,
+    "test_case": TestCase,
+    "practice_record": PracticeRecord,
+}
+_SYNCED_ENTITY_TYPES = {model: entity_type for entity_type, model in SYNCED_MODELS.items()}
+# Collections that are part of a synced entity, so changing them counts as an update
+SYNCED_COLLECTIONS = {
+    Problem: ["tags"],
+}
+
+# Arbitrary key for the Postgres advisory lock guarding change-log inserts
+CHANGE_LOG_LOCK_ID = 726173
+
+def _is_updated(session, obj) -> bool:
+    if session.is_modified(obj, include_collections=False):
+        return True
+    state = inspect(obj)
+    return any(state.attrs[key].history.has_changes() for key in SYNCED_COLLECTIONS.get(type(obj), []))
+
+@event.listens_for(Session, "after_flush")
+def record_changes(session, flush_context):
+    """
+    Append a change-log row for every synced entity written in this flush.
+    Running after the flush means new rows already have their ids, and the
+    log entries are committed (or rolled back) together with the data.
+
+    On Postgres, concurrent transactions could commit out of id order, so each
+    writer takes a transaction-scoped advisory lock before inserting and holds
+    it until commit. SQLite already allows only one writer at a time.
+    """
+    changes = []
+    for operation, objects in (
+        (ChangeOperation.CREATED, session.new),
+        (ChangeOperation.UPDATED, session.dirty),
+        (ChangeOperation.DELETED, session.deleted),
+    ):
+        for obj in objects:
+            entity_type = _SYNCED_ENTITY_TYPES.get(type(obj))
+            if entity_type is None:
+                continue
+            if operation == ChangeOperation.UPDATED and not _is_updated(session, obj):
+                continue
+            changes.append({
+                "entity_type": entity_type,
+                "entity_id": obj.id,
+                "operation": operation,
+            })
+
+    if changes:
+        connection = session.connection()
+        if connection.dialect.name == "postgresql":
+            connection.execute(text("SELECT pg_advisory_xact_lock(:lock_id)"), {"lock_id": CHANGE_LOG_LOCK_ID})
+        connection.execute(ChangeLog.__table__.insert(), changes)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import List
 from . import crud, schemas, database, models
@@ -65,3 +65,7 @@ def get_solution_file(solution_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Solution file not found")
     
     return {"content": content, "language": solution.language}
+
+@router.get("/sync", response_model=schemas.SyncPage)
+def sync(since: int = Query(0, ge=0), limit: int = Query(100, ge=1, le=1000), db: Session = Depends(get_db)):
+    return crud.get_changes_since(db, since=since, limit=limit)
@@ -1,30 +1,43 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, List, Dict, Any
 from app.code_runner import CodeRunner
+from app import runner_backends
 
 router = APIRouter()
 
 class CodeRequest(BaseModel):
     source_code: str
     test_code: Optional[str] = None
+    language: str = "python"
 
 class CodeResponse(BaseModel):
     success: bool
     output: str
     error_message: Optional[str] = None
+    warnings: List[str] = []
+    facts: Optional[Dict[str, Any]] = None
+
+def _require_python(request: CodeRequest):
+    # Validation and unit tests are only implemented for Python
+    if request.language.lower() != "python":
+        raise HTTPException(status_code=400, detail=f"Language not supported: {request.language}")
 
 @router.post("/validate")
 async def validate_code(request: CodeRequest) -> CodeResponse:
+    _require_python(request)
     result = CodeRunner.validate_syntax(request.source_code)
     return CodeResponse(
         success=result.success,
         output=result.output,
-        error_message=result.error_message
+        error_message=result.error_message,
+        warnings=result.warnings,
+        facts=result.facts.to_dict() if result.facts else None
     )
 
 @router.post("/run-tests")
-async def run_tests(request: CodeRequest) -> CodeResponse:
+def run_tests(request: CodeRequest) -> CodeResponse:
+    _require_python(request)
     if not request.test_code:
         raise HTTPException(status_code=400, detail="Test code is required")
     
@@ -32,14 +45,28 @@ async def run_tests(request: CodeRequest) -> CodeResponse:
     return CodeResponse(
         success=result.success,
         output=result.output,
-        error_message=result.error_message
+        error_message=result.error_message,
+        warnings=result.warnings,
+        facts=result.facts.to_dict() if result.facts else None
     )
 
+@router.get("/languages")
+async def list_languages() -> List[str]:
+    return runner_backends.available_languages()
+
+# Plain def so FastAPI runs it in its threadpool: compiling and running
+# block for up to RUN_TIMEOUT each and must not stall the event loop
 @router.post("/execute")
-async def execute_code(request: CodeRequest) -> CodeResponse:
-    result = CodeRunner.execute_code(request.source_code)
+def execute_code(request: CodeRequest) -> CodeResponse:
+    backend = runner_backends.get_backend(request.language)
+    if backend is None:
+        raise HTTPException(status_code=400, detail=f"Language not supported: {request.language}")
+
+    result = backend.execute(request.source_code)
     return CodeResponse(
         success=result.success,
         output=result.output,
-        error_message=result.error_message
+        error_message=result.error_message,
+        warnings=result.warnings,
+        facts=result.facts.to_dict() if result.facts else None
     )
@@ -0,0 +1,503 @@
+import hashlib
+import json
+import os
+import re
+import secrets
+import select
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional, Type
+
+from .code_runner import CodeRunner, RunResult
+
+RUN_TIMEOUT = 10  # seconds per compile or run step
+ARTIFACT_DIR = Path(tempfile.gettempdir()) / "devdojo-artifacts"
+MAX_ARTIFACTS = 256  # compiled builds kept before the least recently used are evicted
+MAX_OUTPUT = 1024 * 1024  # bytes of output captured per run before it is stopped
+
+class RunnerBackend(ABC):
+    """Executes source code for a single language."""
+    language: str = ""
+    # Toolchain executables that must be on PATH for the backend to be usable
+    required_tools: List[str] = []
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return all(shutil.which(tool) for tool in cls.required_tools)
+
+    @abstractmethod
+    def execute(self, code: str) -> RunResult:
+        pass
+
+    def close(self):
+        """Release any long-lived resources held by the backend."""
+        pass
+
+class OutputLimitExceeded(Exception):
+    """Raised when a process writes more than MAX_OUTPUT bytes."""
+
+    def __init__(self, stdout: str):
+        super().__init__(f"output exceeded {MAX_OUTPUT} bytes")
+        self.stdout = stdout
+
+def _read_capped(stream, chunks: List[bytes], exceeded: threading.Event, process: subprocess.Popen):
+    total = 0
+    while True:
+        chunk = stream.read1(65536)
+        if not chunk:
+            return
+        chunks.append(chunk[:max(0, MAX_OUTPUT - total)])
+        total += len(chunk)
+        if total > MAX_OUTPUT:
+            exceeded.set()
+            process.kill()
+            return
+
+def _run_process(command: List[str], cwd: Path) -> subprocess.CompletedProcess:
+    """
+    Run a command like subprocess.run with RUN_TIMEOUT, but read its output
+    through a size limit and kill it once it writes more than MAX_OUTPUT,
+    so a runaway print loop cannot fill the API process's memory.
+    """
+    process = subprocess.Popen(
+        command, cwd=cwd, stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    exceeded = threading.Event()
+    stdout_chunks: List[bytes] = []
+    stderr_chunks: List[bytes] = []
+    readers = [
+        threading.Thread(target=_read_capped, args=(stream, chunks, exceeded, process), daemon=True)
+        for stream, chunks in ((process.stdout, stdout_chunks), (process.stderr, stderr_chunks))
+    ]
+    for reader in readers:
+        reader.start()
+
+    try:
+        process.wait(timeout=RUN_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        for reader in readers:
+            reader.join(timeout=1)
+        process.stdout.close()
+        process.stderr.close()
+
+    stdout = b"".join(stdout_chunks).decode("utf-8", errors="replace")
+    stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+    if exceeded.is_set():
+        raise OutputLimitExceeded(stdout)
+    return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
+
+def _run_program(command: List[str], run_dir: Path) -> RunResult:
+    """Run a prepared program and turn its outcome into a RunResult."""
+    try:
+        result = _run_process(command, run_dir)
+    except subprocess.TimeoutExpired:
+        return RunResult(
+            success=False,
+            output="",
+            error_message=f"Execution Error: timed out after {RUN_TIMEOUT} seconds"
+        )
+    except OutputLimitExceeded as e:
+        return RunResult(success=False, output=e.stdout, error_message=f"Execution Error: {e}")
+    if result.returncode != 0:
+        return RunResult(
+            success=False,
+            output=result.stdout,
+            error_message=f"Execution Error: exited with code {result.returncode}\n{result.stderr}"
+        )
+    return RunResult(success=True, output=result.stdout)
+
+class PythonBackend(RunnerBackend):
+    """
+    Runs Python in a fresh interpreter per submission, after the static
+    analysis pre-flight, so runs are isolated and bounded like other languages.
+    """
+    language = "python"
+
+    def execute(self, code: str) -> RunResult:
+        validation = CodeRunner.validate_syntax(code)
+        if not validation.success:
+            return validation
+
+        with tempfile.TemporaryDirectory(prefix="devdojo-python-run-") as scratch:
+            run_dir = Path(scratch)
+            (run_dir / "solution.py").write_text(code, encoding="utf-8")
+            result = _run_program([sys.executable, "-I", "solution.py"], run_dir)
+        result.warnings = validation.warnings
+        result.facts = validation.facts
+        return result
+
+# Builds are locked by digest, striped over a fixed set of locks so unrelated
+# submissions compile in parallel without the lock table growing forever
+_BUILD_LOCKS = [threading.Lock() for _ in range(64)]
+
+def _build_lock(digest: str) -> threading.Lock:
+    return _BUILD_LOCKS[int(digest[:8], 16) % len(_BUILD_LOCKS)]
+
+def _evict_artifacts():
+    """Remove the least recently used builds beyond MAX_ARTIFACTS."""
+    builds = []
+    for build_dir in ARTIFACT_DIR.iterdir():
+        try:
+            builds.append((build_dir.stat().st_mtime, build_dir))
+        except FileNotFoundError:
+            continue
+    builds = [entry for entry in builds if (entry[1] / ".compiled").exists()]
+    if len(builds) <= MAX_ARTIFACTS:
+        return
+
+    builds.sort()
+    for _, build_dir in builds[:len(builds) - MAX_ARTIFACTS]:
+        lock = _build_lock(build_dir.name.rsplit("-", 1)[-1])
+        # Skip builds that are being compiled or copied right now
+        if lock.acquire(blocking=False):
+            try:
+                shutil.rmtree(build_dir, ignore_errors=True)
+            finally:
+                lock.release()
+
+class CompiledBackend(RunnerBackend):
+    """
+    Compiles the source once per content hash and reuses the artifact.
+    Artifacts live in ARTIFACT_DIR/<language>-<sha256>/, so resubmitting the
+    same code (and restarting the server) skips the compile step entirely.
+    Each run gets a fresh scratch copy of the build, so a submission can
+    neither change the cache nor be affected by its eviction.
+    """
+    source_name: str = ""
+
+    @abstractmethod
+    def compile_command(self, source: Path, build_dir: Path) -> List[str]:
+        pass
+
+    @abstractmethod
+    def run_command(self, build_dir: Path) -> List[str]:
+        pass
+
+    def source_filename(self, code: str) -> str:
+        return self.source_name
+
+    def check_source(self, code: str) -> Optional[str]:
+        """Return an error message if the source cannot be built by this backend."""
+        return None
+
+    def _digest(self, code: str) -> str:
+        return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+    def _build_dir(self, code: str) -> Path:
+        return ARTIFACT_DIR / f"{self.language}-{self._digest(code)}"
+
+    def _compile_locked(self, code: str, build_dir: Path) -> RunResult:
+        # The marker is written last, so a half-finished build is never reused
+        if (build_dir / ".compiled").exists():
+            # Bump the mtime so eviction sees this build as recently used
+            os.utime(build_dir)
+            return RunResult(success=True, output="Using cached build")
+
+        staging_dir = Path(tempfile.mkdtemp(prefix=".staging-", dir=ARTIFACT_DIR))
+        try:
+            source = staging_dir / self.source_filename(code)
+            source.write_text(code, encoding="utf-8")
+            result = _run_process(self.compile_command(source, staging_dir), staging_dir)
+            if result.returncode != 0:
+                return RunResult(
+                    success=False,
+                    output=result.stdout,
+                    error_message=f"Compilation Error: {result.stderr}"
+                )
+            (staging_dir / ".compiled").touch()
+            shutil.rmtree(build_dir, ignore_errors=True)
+            os.replace(staging_dir, build_dir)
+        except subprocess.TimeoutExpired:
+            return RunResult(success=False, output="", error_message="Compilation Error: timed out")
+        except OutputLimitExceeded as e:
+            return RunResult(success=False, output="", error_message=f"Compilation Error: {e}")
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+        return RunResult(success=True, output="Compiled")
+
+    def compile(self, code: str, run_dir: Optional[Path] = None) -> RunResult:
+        """
+        Compile the code unless a cached artifact for it already exists.
+        If run_dir is given, the build is copied there before the lock is
+        released, so eviction cannot remove it in between.
+        """
+        error = self.check_source(code)
+        if error:
+            return RunResult(success=False, output="", error_message=f"Compilation Error: {error}")
+
+        ARTIFACT_DIR.mkdir(parents=True, exist_ok=True)
+        build_dir = self._build_dir(code)
+        with _build_lock(self._digest(code)):
+            result = self._compile_locked(code, build_dir)
+            if result.success and run_dir is not None:
+                shutil.copytree(build_dir, run_dir, dirs_exist_ok=True)
+
+        if result.output == "Compiled":
+            _evict_artifacts()
+        return result
+
+    def execute(self, code: str) -> RunResult:
+        with tempfile.TemporaryDirectory(prefix=f"devdojo-{self.language}-run-") as scratch:
+            run_dir = Path(scratch)
+            compiled = self.compile(code, run_dir)
+            if not compiled.success:
+                return compiled
+            return _run_program(self.run_command(run_dir), run_dir)
+
+class CBackend(CompiledBackend):
+    language = "c"
+    required_tools = ["gcc"]
+    source_name = "solution.c"
+
+    def compile_command(self, source: Path, build_dir: Path) -> List[str]:
+        return ["gcc", "-O2", "-o", str(build_dir / "solution"), str(source), "-lm"]
+
+    def run_command(self, build_dir: Path) -> List[str]:
+        return [str(build_dir / "solution")]
+
+class CppBackend(CompiledBackend):
+    language = "cpp"
+    required_tools = ["g++"]
+    source_name = "solution.cpp"
+
+    def compile_command(self, source: Path, build_dir: Path) -> List[str]:
+        return ["g++", "-O2", "-std=c++17", "-o", str(build_dir / "solution"), str(source)]
+
+    def run_command(self, build_dir: Path) -> List[str]:
+        return [str(build_dir / "solution")]
+
+_JAVA_PUBLIC_CLASS = re.compile(r"public\s+(?:final\s+)?class\s+(\w+)")
+
+class JavaBackend(CompiledBackend):
+    language = "java"
+    required_tools = ["javac", "java"]
+
+    def check_source(self, code: str) -> Optional[str]:
+        if not _JAVA_PUBLIC_CLASS.search(code):
+            return "source must declare a public class with a main method"
+        return None
+
+    def source_filename(self, code: str) -> str:
+        # javac requires the file to be named after the public class
+        return f"{_JAVA_PUBLIC_CLASS.search(code).group(1)}.java"
+
+    def compile_command(self, source: Path, build_dir: Path) -> List[str]:
+        return ["javac", "-d", str(build_dir), str(source)]
+
+    def run_command(self, build_dir: Path) -> List[str]:
+        main_class = next(build_dir.glob("*.java")).stem
+        return ["java", "-cp", str(build_dir), main_class]
+
+# Reads one JSON request per line from the request fd and runs it in a fresh
+# vm context, so the node process (and its JIT warm-up) is shared across
+# submissions. vm is not a security boundary: submitted code can reach
+# `process` and write to the reply fd. Every reply therefore echoes the
+# request's random id, and the backend restarts node on any reply it did
+# not ask for.
+_JS_DRIVER = r"""
+const fs = require('fs');
+const vm = require('vm');
+const util = require('util');
+const readline = require('readline');
+// Captured before any submission runs, so replacing fs.writeSync cannot forge replies
+const writeSync = fs.writeSync;
+const [requestFd, replyFd] = process.argv.slice(-2).map(Number);
+readline.createInterface({ input: fs.createReadStream(null, { fd: requestFd }) }).on('line', (line) => {
+  const { id, code, timeout, maxOutput } = JSON.parse(line);
+  const output = [];
+  let size = 0;
+  let truncated = false;
+  const log = (...args) => {
+    if (truncated) return;
+    const text = args.map((a) => typeof a === 'string' ? a : util.inspect(a)).join(' ') + '\n';
+    size += Buffer.byteLength(text);
+    if (size > maxOutput) {
+      truncated = true;
+      return;
+    }
+    output.push(text);
+  };
+  let error = '';
+  try {
+    // afterEvaluate runs promise jobs inside the call, under the same timeout
+    vm.runInNewContext(code, { console: { log, info: log, warn: log, error: log } },
+                       { timeout, microtaskMode: 'afterEvaluate' });
+  } catch (e) {
+    error = String((e && e.stack) || e);
+  }
+  if (truncated && !error) error = `output exceeded ${maxOutput} bytes`;
+  writeSync(replyFd, JSON.stringify({ id, output: output.join(''), error }) + '\n');
+});
+"""
+
+# Escaped JSON can be several times larger than the output it carries
+_MAX_REPLY = 8 * MAX_OUTPUT + 65536
+
+class JavaScriptBackend(RunnerBackend):
+    """Runs JavaScript in a long-lived node process instead of spawning one per run."""
+    language = "javascript"
+    required_tools = ["node"]
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._process: Optional[subprocess.Popen] = None
+        self._request_fd: Optional[int] = None
+        self._reply_fd: Optional[int] = None
+
+    def _start_process(self):
+        request_read, request_write = os.pipe()
+        reply_read, reply_write = os.pipe()
+        try:
+            self._process = subprocess.Popen(
+                ["node", "-e", _JS_DRIVER, str(request_read), str(reply_write)],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                pass_fds=(request_read, reply_write)
+            )
+        except OSError:
+            for fd in (request_read, request_write, reply_read, reply_write):
+                os.close(fd)
+            raise
+        # The child's ends are only needed in the child
+        os.close(request_read)
+        os.close(reply_write)
+        self._request_fd = request_write
+        self._reply_fd = reply_read
+
+    def _stop_process(self):
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+            self._process = None
+        for fd in (self._request_fd, self._reply_fd):
+            if fd is not None:
+                os.close(fd)
+        self._request_fd = self._reply_fd = None
+
+    def _ensure_clean_process(self):
+        """Start node, or restart it if it died or left unrequested bytes on the reply pipe."""
+        if self._process is not None and self._process.poll() is None:
+            ready, _, _ = select.select([self._reply_fd], [], [], 0)
+            if not ready:
+                return
+        self._stop_process()
+        self._start_process()
+
+    def _read_reply(self, deadline: float) -> Optional[bytes]:
+        """
+        Read exactly one reply line. Returns None if the process dies, the
+        deadline passes, the reply is too large or more bytes follow it.
+        """
+        reply = b""
+        while not reply.endswith(b"\n"):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            ready, _, _ = select.select([self._reply_fd], [], [], remaining)
+            if not ready:
+                return None
+            chunk = os.read(self._reply_fd, 65536)
+            if not chunk or len(reply) + len(chunk) > _MAX_REPLY:
+                return None
+            reply += chunk
+            if b"\n" in reply[:-1]:
+                return None
+        return reply
+
+    def _execute_once(self, code: str) -> Optional[RunResult]:
+        """Run the code once; returns None if node broke the protocol and was stopped."""
+        request_id = secrets.token_hex(16)
+        request = json.dumps({
+            "id": request_id,
+            "code": code,
+            "timeout": RUN_TIMEOUT * 1000,
+            "maxOutput": MAX_OUTPUT,
+        }) + "\n"
+
+        self._ensure_clean_process()
+        try:
+            os.write(self._request_fd, request.encode("utf-8"))
+        except OSError:
+            self._stop_process()
+            return None
+
+        # The vm timeout normally fires first; this guards against a wedged process
+        deadline = time.monotonic() + RUN_TIMEOUT + 5
+        reply = self._read_reply(deadline)
+        if reply is None:
+            timed_out = time.monotonic() >= deadline
+            self._stop_process()
+            if timed_out:
+                return RunResult(
+                    success=False,
+                    output="",
+                    error_message=f"Execution Error: timed out after {RUN_TIMEOUT} seconds"
+                )
+            return None
+
+        try:
+            result = json.loads(reply)
+            if result["id"] != request_id:
+                raise ValueError("reply for another request")
+            output, error = result["output"], result["error"]
+        except (ValueError, KeyError, TypeError):
+            self._stop_process()
+            return None
+
+        if error:
+            return RunResult(
+                success=False,
+                output=output,
+                error_message=f"Execution Error: {error}"
+            )
+        return RunResult(success=True, output=output)
+
+    def execute(self, code: str) -> RunResult:
+        with self._lock:
+            # A protocol violation may have been planted by an earlier
+            # submission, so retry once on a fresh process before failing
+            for _ in range(2):
+                result = self._execute_once(code)
+                if result is not None:
+                    return result
+        return RunResult(success=False, output="", error_message="Execution Error: invalid reply from node process")
+
+    def close(self):
+        with self._lock:
+            self._stop_process()
+
+BACKEND_CLASSES: List[Type[RunnerBackend]] = [
+    PythonBackend,
+    JavaScriptBackend,
+    JavaBackend,
+    CppBackend,
+    CBackend,
+]
+
+_backends: Dict[str, RunnerBackend] = {}
+
+def discover_backends() -> Dict[str, RunnerBackend]:
+    """Register a backend for every language whose toolchain is installed locally."""
+    for backend in _backends.values():
+        backend.close()
+    _backends.clear()
+    for backend_class in BACKEND_CLASSES:
+        if backend_class.is_available():
+            _backends[backend_class.language] = backend_class()
+    return _backends
+
+def get_backend(language: str) -> Optional[RunnerBackend]:
+    return _backends.get(language.lower())
+
+def available_languages() -> List[str]:
+    return sorted(_backends)
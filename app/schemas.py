@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -8,6 +8,11 @@ class DifficultyLevel(str, Enum):
     MEDIUM = "medium"
     HARD = "hard"
 
+class ChangeOperation(str, Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
 class TagBase(BaseModel):
     name: str
 
@@ -30,6 +35,7 @@ class TestCaseCreate(TestCaseBase):
 class TestCase(TestCaseBase):
     id: int
     created_at: datetime
+    updated_at: Optional[datetime] = None
     solution_id: int
 
     class Config:
@@ -45,6 +51,9 @@ class SolutionCreate(SolutionBase):
 class Solution(SolutionBase):
     id: int
     created_at: datetime
+    updated_at: Optional[datetime] = None
+    content_hash: Optional[str] = None
+    analysis: Optional[Dict[str, Any]] = None
     problem_id: int
     test_cases: List[TestCase] = []
 
@@ -81,6 +90,20 @@ class PracticeRecordCreate(PracticeRecordBase):
 class PracticeRecord(PracticeRecordBase):
     id: int
     created_at: datetime
+    updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
+
+class Change(BaseModel):
+    cursor: int
+    entity_type: str
+    entity_id: int
+    operation: ChangeOperation
+    changed_at: Optional[datetime] = None
+    data: Optional[Dict[str, Any]] = None
+
+class SyncPage(BaseModel):
+    changes: List[Change] = []
+    next_cursor: int
+    has_more: bool
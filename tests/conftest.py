@@ -0,0 +1,22 @@
+import os
+import tempfile
+
+# Point the app at a throwaway database before app.database is imported
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+
+import pytest
+
+from app import crud
+from app.database import Base, SessionLocal, engine
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(crud.file_manager, "base_path", tmp_path)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
@@ -0,0 +1,139 @@
+import pytest
+
+from app import code_analysis
+from app.code_analysis import analyze_code
+from app.code_runner import CodeRunner
+
+def test_extracts_facts():
+    facts = analyze_code(
+        "import math\n"
+        "class Helper:\n"
+        "    pass\n"
+        "def solution(nums):\n"
+        "    for a in nums:\n"
+        "        for b in nums:\n"
+        "            if a and b:\n"
+        "                return math.gcd(a, b)\n"
+    )
+    assert facts.functions == ("solution",)
+    assert facts.classes == ("Helper",)
+    assert facts.imports == ("math",)
+    assert facts.max_loop_depth == 2
+    assert facts.cyclomatic_complexity == 5
+    assert facts.errors == ()
+    assert facts.warnings == ()
+
+def test_facts_are_cached_by_content_hash():
+    code = "def solution():\n    return 42\n"
+    facts = analyze_code(code)
+    assert analyze_code(code) is facts
+    assert code_analysis._facts_cache[code_analysis.content_hash(code)] is facts
+
+@pytest.mark.parametrize("code", [
+    "import os",
+    "from subprocess import run",
+    "import importlib",
+    "__import__('os').system('ls')",
+    "eval('1 + 1')",
+    "exec('x = 1')",
+    "compile('x', 'f', 'exec')",
+    "importlib.import_module('subprocess')",
+])
+def test_rejects_forbidden_code(code):
+    assert analyze_code(code).errors
+
+def test_rejects_loop_that_cannot_exit():
+    facts = analyze_code("def solution(nums):\n    while True:\n        for i in nums:\n            break\n")
+    assert facts.errors == ("Infinite loop without break on line 2",)
+
+@pytest.mark.parametrize("code", [
+    "def solution():\n    while True:\n        break\n",
+    "def solution():\n    i = 0\n    while True:\n        yield i\n",
+    "def solution(it):\n    while True:\n        yield from it\n",
+    "async def solution(q):\n    while True:\n        await q.get()\n",
+    "import sys\ndef solution():\n    while True:\n        sys.exit(0)\n",
+    "def solution():\n    while 1:\n        for i in range(3):\n            if i:\n                return i\n",
+    "def solution():\n    i = 0\n    while True:\n        i += 1\n        assert i < 10\n",
+    "def solution(a):\n"
+    "    t = i = 0\n"
+    "    try:\n"
+    "        while True:\n"
+    "            t += a[i]\n"
+    "            i += 1\n"
+    "    except IndexError:\n"
+    "        return t\n",
+])
+def test_accepts_loops_that_exit(code):
+    facts = analyze_code(code)
+    assert facts.errors == ()
+    assert not any(warning.startswith("Missing") for warning in facts.warnings)
+
+@pytest.mark.parametrize("body", ["step()", "x = a[0]", "x = a.b", "x = 1 / a"])
+def test_warns_on_loop_that_may_not_exit(body):
+    facts = analyze_code(f"def solution(a):\n    while True:\n        {body}\n")
+    assert facts.errors == ()
+    assert facts.warnings == ("Possible infinite loop on line 2: no break, return or raise",)
+
+def test_facts_cache_is_thread_safe(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    monkeypatch.setattr(code_analysis, "CACHE_SIZE", 4)
+    codes = [f"def solution():\n    return {i}\n" for i in range(16)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(analyze_code, codes * 50))
+    assert all(facts.functions == ("solution",) for facts in results)
+    assert len(code_analysis._facts_cache) <= 4
+
+def test_warns_on_missing_entry_point():
+    assert analyze_code("print(1)").warnings == ("Missing entry point: no 'solution' function defined",)
+
+def test_deeply_nested_code_does_not_crash_validation():
+    code = "def solution():\n    return " + " + ".join(["1"] * 2500)
+    assert CodeRunner.validate_syntax(code).success
+
+def test_solution_too_deep_to_parse_is_saved_without_analysis(db):
+    from app import crud, schemas
+
+    problem = crud.create_problem(db, schemas.ProblemCreate(
+        title="Deep", description="", difficulty="easy", source_url=""
+    ))
+    code = "def solution():\n    return " + " + ".join(["1"] * 100000)
+    solution = crud.create_solution(db, schemas.SolutionCreate(
+        problem_id=problem.id, code=code, language="python"
+    ))
+    assert solution.analysis is None
+    assert solution.content_hash == code_analysis.content_hash(code)
+
+def test_run_tests_reports_source_analysis():
+    result = CodeRunner.run_tests(
+        "def solution(n):\n    while True:\n        n = step(n)\n\ndef step(n):\n    raise StopIteration\n",
+        "import unittest\n"
+        "class T(unittest.TestCase):\n"
+        "    def test_step(self):\n"
+        "        self.assertRaises(StopIteration, step, 1)\n",
+    )
+    assert result.success
+    assert result.facts.functions == ("solution", "step")
+    assert result.warnings == ["Possible infinite loop on line 2: no break, return or raise"]
+
+def test_execute_code_reports_analysis():
+    result = CodeRunner.execute_code("def solution():\n    return 1\n\nprint(solution())\n")
+    assert result.success
+    assert result.output == "1\n"
+    assert result.facts.functions == ("solution",)
+
+def test_missing_analysis_is_filled_on_read(db):
+    from app import crud, models, schemas
+
+    problem = crud.create_problem(db, schemas.ProblemCreate(
+        title="Old", description="", difficulty="easy", source_url=""
+    ))
+    solution = crud.create_solution(db, schemas.SolutionCreate(
+        problem_id=problem.id, code="def solution():\n    return 1\n", language="python"
+    ))
+    # Simulate a row saved before analysis was recorded
+    db.query(models.Solution).filter(models.Solution.id == solution.id).update({"analysis": None})
+    db.commit()
+
+    [loaded] = crud.get_solutions(db, problem.id)
+    assert loaded.analysis["functions"] == ["solution"]
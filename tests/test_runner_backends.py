@@ -0,0 +1,201 @@
+import pytest
+
+from app import runner_backends
+from app.runner_backends import CBackend, CompiledBackend, JavaBackend, JavaScriptBackend, PythonBackend
+
+needs_gcc = pytest.mark.skipif(not CBackend.is_available(), reason="gcc not installed")
+needs_node = pytest.mark.skipif(not JavaScriptBackend.is_available(), reason="node not installed")
+
+C_PROGRAM = '#include <stdio.h>\nint main() { printf("hello %d\\n", %d); return 0; }\n'
+
+@pytest.fixture(autouse=True)
+def artifact_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(runner_backends, "ARTIFACT_DIR", tmp_path / "artifacts")
+    return tmp_path / "artifacts"
+
+@pytest.fixture
+def js_backend():
+    backend = JavaScriptBackend()
+    yield backend
+    backend.close()
+
+@needs_gcc
+def test_compile_cache_miss_then_hit(monkeypatch):
+    backend = CBackend()
+    compiles = []
+    run_process = runner_backends._run_process
+
+    def counting_run_process(command, cwd):
+        if command[0] == "gcc":
+            compiles.append(command)
+        return run_process(command, cwd)
+
+    monkeypatch.setattr(runner_backends, "_run_process", counting_run_process)
+    code = C_PROGRAM.replace("%d);", "1);")
+
+    first = backend.execute(code)
+    second = backend.execute(code)
+
+    assert first.success and first.output == "hello 1\n"
+    assert second.success and second.output == "hello 1\n"
+    assert len(compiles) == 1
+    assert backend.compile(code).output == "Using cached build"
+
+@needs_gcc
+def test_compile_error_is_not_cached():
+    backend = CBackend()
+    code = "int main() { return 0 }"
+    result = backend.execute(code)
+    assert not result.success
+    assert result.error_message.startswith("Compilation Error")
+    assert not backend._build_dir(code).exists()
+
+@needs_gcc
+def test_run_cannot_modify_cache():
+    backend = CBackend()
+    code = '#include <unistd.h>\nint main() { return unlink(".compiled") == 0 ? 0 : 3; }\n'
+    result = backend.execute(code)
+    # The program removed the marker from its scratch copy, not from the cache
+    assert result.success
+    assert (backend._build_dir(code) / ".compiled").exists()
+
+@needs_gcc
+def test_least_recently_used_builds_are_evicted(monkeypatch):
+    monkeypatch.setattr(runner_backends, "MAX_ARTIFACTS", 2)
+    backend = CBackend()
+    codes = [C_PROGRAM.replace("%d);", f"{i});") for i in range(3)]
+    for code in codes:
+        assert backend.execute(code).success
+
+    assert not backend._build_dir(codes[0]).exists()
+    assert backend._build_dir(codes[1]).exists()
+    assert backend._build_dir(codes[2]).exists()
+
+@needs_gcc
+def test_compiled_output_is_capped(monkeypatch):
+    monkeypatch.setattr(runner_backends, "MAX_OUTPUT", 4096)
+    result = CBackend().execute('#include <stdio.h>\nint main() { for (;;) puts("x"); }\n')
+    assert not result.success
+    assert "output exceeded 4096 bytes" in result.error_message
+    assert len(result.output) <= 4096
+
+def test_backend_missing_methods_fails_on_creation():
+    class Incomplete(CompiledBackend):
+        language = "incomplete"
+
+        def compile_command(self, source, build_dir):
+            return []
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+def test_python_runs_in_subprocess_with_analysis():
+    result = PythonBackend().execute("def solution():\n    return 1\n\nprint(solution())\n")
+    assert result.success
+    assert result.output == "1\n"
+    assert result.facts.functions == ("solution",)
+
+def test_python_rejected_by_preflight():
+    result = PythonBackend().execute("import os\n")
+    assert not result.success
+    assert result.error_message.startswith("Static Analysis Error")
+
+def test_python_concurrent_runs_keep_their_output():
+    from concurrent.futures import ThreadPoolExecutor
+
+    code = "import time\nfor i in range(5):\n    print('{name}', i)\n    time.sleep(0.01)\n"
+    backend = PythonBackend()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        a, b = pool.map(backend.execute, [code.format(name="A"), code.format(name="B")])
+    assert a.output == "".join(f"A {i}\n" for i in range(5))
+    assert b.output == "".join(f"B {i}\n" for i in range(5))
+
+def test_python_run_times_out(monkeypatch):
+    monkeypatch.setattr(runner_backends, "RUN_TIMEOUT", 1)
+    result = PythonBackend().execute("import time\ntime.sleep(5)\n")
+    assert not result.success
+    assert "timed out" in result.error_message
+
+def test_python_output_is_capped(monkeypatch):
+    monkeypatch.setattr(runner_backends, "MAX_OUTPUT", 4096)
+    result = PythonBackend().execute("def solution():\n    pass\nfor i in range(10 ** 6):\n    print(i)\n")
+    assert not result.success
+    assert "output exceeded" in result.error_message
+
+def test_java_without_public_class_is_rejected():
+    result = JavaBackend().compile("class Solution { public static void main(String[] a) {} }")
+    assert not result.success
+    assert "public class" in result.error_message
+
+@needs_node
+def test_js_runs_in_fresh_context(js_backend):
+    assert js_backend.execute("let x = 1; console.log('js', [x])").output == "js [ 1 ]\n"
+    assert js_backend.execute("let x = 2; console.log(x)").output == "2\n"
+
+@needs_node
+def test_js_captures_async_output(js_backend):
+    result = js_backend.execute("Promise.resolve().then(() => console.log('async'))")
+    assert result.success
+    assert result.output == "async\n"
+
+@needs_node
+def test_js_promise_loop_times_out_without_wedging(js_backend, monkeypatch):
+    monkeypatch.setattr(runner_backends, "RUN_TIMEOUT", 1)
+    result = js_backend.execute("Promise.resolve().then(() => { while (true) {} })")
+    assert not result.success
+    assert js_backend.execute("console.log('next')").output == "next\n"
+
+@needs_node
+def test_js_output_is_capped(js_backend, monkeypatch):
+    monkeypatch.setattr(runner_backends, "MAX_OUTPUT", 4096)
+    result = js_backend.execute("for (let i = 0; i < 100000; i++) console.log(i)")
+    assert not result.success
+    assert "output exceeded 4096 bytes" in result.error_message
+    assert len(result.output) <= 4096
+    assert js_backend.execute("console.log('next')").output == "next\n"
+
+@needs_node
+def test_js_forged_reply_is_rejected(js_backend):
+    code = (
+        "const p = this.constructor.constructor('return process')();"
+        "const fs = this.constructor.constructor('return require')()('fs');"
+        "const fd = Number(p.argv[p.argv.length - 1]);"
+        "fs.writeSync(fd, JSON.stringify({ id: 'x', output: 'forged\\n', error: '' }) + '\\n');"
+        "setTimeout(() => fs.writeSync(fd, JSON.stringify({ id: 'y', output: 'mine\\n', error: '' }) + '\\n'), 50);"
+    )
+    result = js_backend.execute(code)
+    assert result.output != "forged\n"
+    assert not result.success
+
+    for expected in ("first", "second"):
+        assert js_backend.execute(f"console.log('{expected}')").output == f"{expected}\n"
+
+@needs_node
+def test_js_deferred_forged_reply_does_not_reach_next_caller(js_backend):
+    code = (
+        "const p = this.constructor.constructor('return process')();"
+        "const fs = this.constructor.constructor('return require')()('fs');"
+        "const fd = Number(p.argv[p.argv.length - 1]);"
+        "p.nextTick(() => fs.writeSync(fd, JSON.stringify({ id: 'y', output: 'mine\\n', error: '' }) + '\\n'));"
+        "console.log('attacker')"
+    )
+    js_backend.execute(code)
+    for expected in ("first", "second"):
+        assert js_backend.execute(f"console.log('{expected}')").output == f"{expected}\n"
+
+@needs_node
+def test_js_stdout_writes_do_not_break_protocol(js_backend):
+    result = js_backend.execute(
+        "this.constructor.constructor('return process')().stdout.write('garbage\\n'); console.log('ok')"
+    )
+    assert result.output == "ok\n"
+    assert js_backend.execute("console.log('next')").output == "next\n"
+
+def test_routes_reject_non_python_validation():
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    client = TestClient(app)
+    for path in ("/code-runner/validate", "/code-runner/run-tests"):
+        response = client.post(path, json={"source_code": "class Main {}", "test_code": "x", "language": "java"})
+        assert response.status_code == 400
@@ -0,0 +1,90 @@
+from app import crud, models, schemas
+
+def _create_problem(db, title="Two Sum", tags=()):
+    return crud.create_problem(db, schemas.ProblemCreate(
+        title=title,
+        description="Find two numbers",
+        difficulty="easy",
+        source_url="https://example.com",
+        tags=list(tags),
+    ))
+
+def _create_solution(db, problem_id):
+    return crud.create_solution(db, schemas.SolutionCreate(
+        problem_id=problem_id,
+        code="def solution(nums):\n    return nums\n",
+        language="python",
+    ))
+
+def test_pages_follow_cursor(db):
+    problems = [_create_problem(db, title=f"Problem {i}") for i in range(3)]
+
+    first = crud.get_changes_since(db, since=0, limit=2)
+    assert [change.entity_id for change in first.changes] == [problems[0].id, problems[1].id]
+    assert first.has_more
+
+    second = crud.get_changes_since(db, since=first.next_cursor, limit=2)
+    assert [change.entity_id for change in second.changes] == [problems[2].id]
+    assert not second.has_more
+
+    empty = crud.get_changes_since(db, since=second.next_cursor)
+    assert empty.changes == []
+    assert empty.next_cursor == second.next_cursor
+
+def test_changes_to_same_row_are_collapsed(db):
+    problem = _create_problem(db)
+    problem.title = "Renamed"
+    db.commit()
+
+    page = crud.get_changes_since(db, since=0)
+    assert len(page.changes) == 1
+    change = page.changes[0]
+    assert change.operation == schemas.ChangeOperation.UPDATED
+    assert change.data["title"] == "Renamed"
+
+def test_tag_changes_are_logged(db):
+    problem = _create_problem(db, tags=["arrays", "hashing"])
+    cursor = crud.get_changes_since(db, since=0).next_cursor
+
+    problem.tags.pop()
+    db.commit()
+
+    page = crud.get_changes_since(db, since=cursor)
+    assert len(page.changes) == 1
+    assert page.changes[0].operation == schemas.ChangeOperation.UPDATED
+    assert page.changes[0].data["tags"] == ["arrays"]
+
+def test_deleted_solution_is_reported(db):
+    problem = _create_problem(db)
+    solution = _create_solution(db, problem.id)
+    cursor = crud.get_changes_since(db, since=0).next_cursor
+
+    assert crud.file_manager.delete_solution(db, solution.id)
+
+    page = crud.get_changes_since(db, since=cursor)
+    deleted = [change for change in page.changes if change.entity_type == "solution"]
+    assert deleted[0].operation == schemas.ChangeOperation.DELETED
+    assert deleted[0].data is None
+
+def test_created_then_deleted_row_is_reported_as_deleted(db):
+    problem = _create_problem(db)
+    solution = _create_solution(db, problem.id)
+    crud.file_manager.delete_solution(db, solution.id)
+
+    # The page ends before the DELETED entry, but the row is already gone
+    entries = db.query(models.ChangeLog).order_by(models.ChangeLog.id).all()
+    created = next(entry for entry in entries if entry.entity_type == "solution")
+    page = crud.get_changes_since(db, since=0, limit=created.id)
+
+    change = next(change for change in page.changes if change.entity_type == "solution")
+    assert change.operation == schemas.ChangeOperation.DELETED
+    assert change.data is None
+
+def test_sync_endpoint_caps_page_size(db):
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    client = TestClient(app)
+    assert client.get("/api/v1/sync", params={"limit": 1000}).status_code == 200
+    assert client.get("/api/v1/sync", params={"limit": 1001}).status_code == 422
+    assert client.get("/api/v1/sync", params={"since": -1}).status_code == 422